@@ -0,0 +1,102 @@
+"""
+Fuzzy Search Benchmark
+Measures typo-tolerant search latency at 10k and 100k rows
+
+Builds synthetic faculty directories, misspells existing words (one edit
+each: substitution, deletion, insertion or swapped letters) and times
+FuzzyTermIndex.search() against a brute-force baseline that runs the
+bounded edit distance against every distinct term.
+
+Usage (from the repository root):
+    python benchmarks/fuzzy_search_benchmark.py
+"""
+
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+# Import the app module from the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import app  # noqa: E402
+
+SYLLABLES = ["ra", "mesh", "bro", "jo", "ki", "shore", "mi", "shra", "an", "jali",
+             "pra", "deep", "su", "nita", "ku", "mar", "de", "vi", "ar", "jun"]
+DEPARTMENTS = ["CSE", "ECE", "EEE", "Mechanical", "Civil", "MBA", "Physics", "Mathematics"]
+SUBJECTS = ["DBMS", "Data Structures", "Operating Systems", "Thermodynamics", "Signals",
+            "Linear Algebra", "Compiler Design", "Networks", "Fluid Mechanics", "Marketing"]
+ROLES = ["Professor", "Associate Professor", "Assistant Professor", "HOD", "Dean"]
+
+ROW_COUNTS = [10_000, 100_000]
+QUERY_COUNT = 200
+BASELINE_QUERY_COUNT = 20
+
+
+def make_word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def make_faculty_frame(rows, rng):
+    return pd.DataFrame({
+        'Name': [f"{make_word(rng)} {make_word(rng)}" for _ in range(rows)],
+        'Department': [rng.choice(DEPARTMENTS) for _ in range(rows)],
+        'Subject': [rng.choice(SUBJECTS) for _ in range(rows)],
+        'Role': [rng.choice(ROLES) for _ in range(rows)],
+        'Room': [f"{rng.choice(DEPARTMENTS)[:2].upper()}-{rng.randint(100, 999)}" for _ in range(rows)],
+    })
+
+
+def misspell(word, rng):
+    position = rng.randrange(len(word) - 1)
+    kind = rng.choice(["substitute", "delete", "insert", "swap"])
+    if kind == "substitute":
+        return word[:position] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[position + 1:]
+    if kind == "delete":
+        return word[:position] + word[position + 1:]
+    if kind == "insert":
+        return word[:position] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[position:]
+    return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+
+
+def brute_force_search(index, query):
+    """Baseline: bounded edit distance against every distinct term."""
+    term = app.squash_term(query)
+    limit = app.max_typos(term)
+    return [t for t in index.terms if app.bounded_edit_distance(term, t, limit) <= limit]
+
+
+def time_per_query(search, queries):
+    started = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - started) / len(queries) * 1000
+
+
+def main():
+    rng = random.Random(42)
+    fields = app.SEARCH_FIELDS['faculty']
+    
+    print(f"{'rows':>8} {'terms':>8} {'build (s)':>10} {'fuzzy (ms)':>11} {'brute force (ms)':>17}")
+    
+    for rows in ROW_COUNTS:
+        df = make_faculty_frame(rows, rng)
+        
+        started = time.perf_counter()
+        index = app.FuzzyTermIndex(df, fields)
+        build_seconds = time.perf_counter() - started
+        
+        # Misspell words of at least 5 letters so one typo is within budget
+        words = [w for w in " ".join(df['Name'].head(5000)).split() if len(w) >= 5]
+        queries = [misspell(rng.choice(words), rng) for _ in range(QUERY_COUNT)]
+        
+        fuzzy_ms = time_per_query(index.search, queries)
+        baseline_ms = time_per_query(lambda q: brute_force_search(index, q), queries[:BASELINE_QUERY_COUNT])
+        
+        print(f"{rows:>8} {len(index.terms):>8} {build_seconds:>10.2f} {fuzzy_ms:>11.3f} {baseline_ms:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import time
+
+from app import AnswerCache, normalize_question
+
+
+def test_normalize_question_drops_case_punctuation_and_stop_words():
+    assert normalize_question("Where is the Admission Office?") == "where admission office"
+    assert normalize_question("where is admission   office") == "where admission office"
+    assert normalize_question("Who's the HOD of C.S.E.?") == "whos hod cse"
+
+
+def test_normalize_question_keeps_question_words():
+    assert normalize_question("Where is the library?") != normalize_question("When is the library open?")
+
+
+def test_cached_answer_expires_after_ttl():
+    cache = AnswerCache(ttl_seconds=0.1)
+    cache.put(('v1', 'where library'), "Block B")
+    
+    assert cache.get(('v1', 'where library')) == "Block B"
+    time.sleep(0.15)
+    assert cache.get(('v1', 'where library')) is None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'entries': 0}
+
+
+def test_least_recently_used_answer_is_evicted():
+    cache = AnswerCache(max_entries=2)
+    cache.put('a', "answer a")
+    cache.put('b', "answer b")
+    
+    # Reading 'a' makes 'b' the least recently used
+    cache.get('a')
+    cache.put('c', "answer c")
+    
+    assert cache.get('b') is None
+    assert cache.get('a') == "answer a"
+    assert cache.get('c') == "answer c"
+
+
+def test_new_data_version_misses():
+    cache = AnswerCache()
+    cache.put((('faculty', 1),), "old answer")
+    assert cache.get((('faculty', 2),)) is None
@@ -0,0 +1,91 @@
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app import CalendarEventSync
+
+NOW = datetime(2026, 10, 16, 9, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
+
+
+def make_event(event_id, day, start_hour, summary):
+    return {
+        'id': event_id,
+        'status': 'confirmed',
+        'summary': summary,
+        'start': {'dateTime': f"{day}T{start_hour:02d}:00:00+05:30"},
+        'end': {'dateTime': f"{day}T{start_hour + 1:02d}:00:00+05:30"},
+    }
+
+
+@pytest.fixture
+def calendar_stub():
+    """A local Calendar API stub: serves stub.items and records each request's params."""
+    
+    class Stub:
+        items = []
+        requests = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+        
+        def do_GET(self):
+            Stub.requests.append(parse_qs(urlparse(self.path).query))
+            body = json.dumps({'items': Stub.items}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Stub.base_url = f"http://127.0.0.1:{server.server_port}"
+    yield Stub
+    server.shutdown()
+
+
+def test_event_moved_to_another_day_is_dropped_by_incremental_sync(calendar_stub):
+    sync = CalendarEventSync(base_url=calendar_stub.base_url)
+    
+    calendar_stub.items = [
+        make_event('a', '2026-10-16', 10, 'Ram Das – Circuits'),
+        make_event('b', '2026-10-16', 14, 'Brojo Kishore Mishra – DBMS'),
+    ]
+    events, error = sync.sync(NOW)
+    assert error is None
+    assert [event['id'] for event in events] == ['a', 'b']
+    
+    # 'b' is moved to tomorrow: it no longer overlaps today's window
+    calendar_stub.items = [make_event('b', '2026-10-17', 14, 'Brojo Kishore Mishra – DBMS')]
+    events, error = sync.sync(NOW.replace(minute=5))
+    assert error is None
+    assert [event['id'] for event in events] == ['a']
+    assert sync.last_changed == 1
+    
+    incremental = calendar_stub.requests[-1]
+    assert 'updatedMin' in incremental
+    assert 'timeMin' not in incremental and 'timeMax' not in incremental
+
+
+def test_event_with_unparseable_time_is_skipped(calendar_stub):
+    sync = CalendarEventSync(base_url=calendar_stub.base_url)
+    
+    naive = make_event('naive', '2026-10-16', 11, 'Ram Das – Circuits')
+    naive['start']['dateTime'] = "2026-10-16T11:00:00"
+    naive['end']['dateTime'] = "2026-10-16T12:00:00"
+    malformed = make_event('malformed', '2026-10-16', 12, 'Ram Das – Circuits')
+    malformed['start']['dateTime'] = "today at noon"
+    utc = make_event('utc', '2026-10-16', 13, 'Brojo Kishore Mishra – DBMS')
+    utc['start']['dateTime'] = "2026-10-16T07:30:00Z"
+    utc['end']['dateTime'] = "2026-10-16T08:30:00Z"
+    
+    calendar_stub.items = [make_event('a', '2026-10-16', 10, 'Ram Das – Circuits'), naive, malformed, utc]
+    events, error = sync.sync(NOW)
+    assert error is None
+    assert sorted(event['id'] for event in events) == ['a', 'utc']
@@ -0,0 +1,46 @@
+import pytest
+
+from app import SHEET_SCHEMAS, FacultyEventMatcher, parse_faculty_name_from_event, parse_sheet_csv
+
+ROSTER = parse_sheet_csv(
+    b"Name,Department,Subject,Role,Room\n"
+    b"Brojo Kishore Mishra,CSE,DBMS,HOD,CS-201\n"
+    b"Ram Das,ECE,Circuits,Professor,EC-101\n"
+    b"Ramesh Das,ME,Thermodynamics,Professor,ME-5\n",
+    SHEET_SCHEMAS['faculty']
+)
+
+
+@pytest.fixture
+def matcher():
+    return FacultyEventMatcher(ROSTER, 1)
+
+
+def faculty_id(name):
+    return ROSTER.loc[ROSTER['Name'] == name, 'Faculty ID'].iloc[0]
+
+
+def resolve_title(matcher, title):
+    return matcher.resolve(parse_faculty_name_from_event(title))
+
+
+def test_only_whole_names_match(matcher):
+    assert resolve_title(matcher, "Ram Das – Circuits Lab") == (faculty_id("Ram Das"),)
+    assert resolve_title(matcher, "Ramesh Das – Thermodynamics") == (faculty_id("Ramesh Das"),)
+
+
+def test_partial_name_does_not_match(matcher):
+    assert resolve_title(matcher, "Ram – Circuits") == ()
+    assert resolve_title(matcher, "Rames Das – Thermodynamics") == ()
+
+
+def test_name_inside_a_longer_title_matches(matcher):
+    assert resolve_title(matcher, "Brojo Kishore Mishra (CSE) – DBMS") == (faculty_id("Brojo Kishore Mishra"),)
+
+
+def test_first_and_last_name_alias(matcher):
+    assert resolve_title(matcher, "Brojo Mishra – DBMS") == (faculty_id("Brojo Kishore Mishra"),)
+
+
+def test_empty_roster_matches_nobody():
+    assert FacultyEventMatcher(ROSTER.iloc[0:0], 1).resolve("Ram Das") == ()
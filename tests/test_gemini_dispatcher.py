@@ -0,0 +1,30 @@
+import time
+
+import pytest
+
+from app import GeminiDispatcher
+
+
+class StopWaiting(Exception):
+    """Stands in for Streamlit stopping the script while a question is queued."""
+
+
+def test_interrupted_waiter_gives_up_its_place_in_line():
+    dispatcher = GeminiDispatcher(max_in_flight=1, requests_per_minute=600, burst=5,
+                                  max_queue=5, max_wait_seconds=5)
+    assert dispatcher.acquire()
+    
+    def interrupt(position):
+        raise StopWaiting()
+    
+    with pytest.raises(StopWaiting):
+        dispatcher.acquire(on_wait=interrupt)
+    
+    assert dispatcher.stats()['queued'] == 0
+    
+    # The next question is admitted as soon as the slot frees up
+    dispatcher.release()
+    started = time.monotonic()
+    assert dispatcher.acquire()
+    assert time.monotonic() - started < 1
+    assert dispatcher.stats() == {'in_flight': 1, 'queued': 0, 'admitted': 2, 'shed': 0}
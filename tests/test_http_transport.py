@@ -0,0 +1,116 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import app
+from app import CircuitBreaker, CircuitOpenError, get_retry_delay, http_get
+
+
+@pytest.fixture
+def upstream():
+    """A local upstream answering with the queued statuses (then the default)."""
+    
+    class Stub:
+        statuses = []
+        default = 200
+        hits = 0
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def log_message(self, *args):
+            pass
+        
+        def do_GET(self):
+            Stub.hits += 1
+            status = Stub.statuses.pop(0) if Stub.statuses else Stub.default
+            body = b"ok"
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Stub.url = f"http://127.0.0.1:{server.server_port}/export"
+    yield Stub
+    server.shutdown()
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """A fresh breaker for the 'sheets' endpoint, reopening after 0.2s."""
+    breaker = CircuitBreaker('sheets', failure_threshold=3, reset_seconds=0.2)
+    monkeypatch.setattr(app, 'get_circuit_breakers', lambda: {'sheets': breaker})
+    monkeypatch.setattr(app, 'HTTP_BACKOFF_BASE_SECONDS', 0.001)
+    return breaker
+
+
+def test_retries_5xx_then_succeeds(upstream, breaker):
+    upstream.statuses = [503, 502]
+    response = http_get('sheets', upstream.url)
+    
+    assert response.status_code == 200
+    assert upstream.hits == 3
+    assert breaker.stats()['state'] == 'closed'
+
+
+def test_not_found_is_not_retried(upstream, breaker):
+    upstream.default = 404
+    assert http_get('sheets', upstream.url).status_code == 404
+    assert upstream.hits == 1
+    assert breaker.stats()['failures'] == 0
+
+
+def test_breaker_opens_half_opens_and_closes(upstream, breaker):
+    upstream.default = 503
+    for _ in range(3):
+        assert http_get('sheets', upstream.url).status_code == 503
+    assert breaker.stats()['state'] == 'open'
+    
+    # Open: refused without touching upstream
+    hits = upstream.hits
+    with pytest.raises(CircuitOpenError):
+        http_get('sheets', upstream.url)
+    assert upstream.hits == hits
+    
+    # Half-open: one trial request; failing it reopens the circuit
+    time.sleep(0.25)
+    assert breaker.stats()['state'] == 'half-open'
+    assert http_get('sheets', upstream.url).status_code == 503
+    assert breaker.stats()['state'] == 'open'
+    
+    # A successful trial closes it
+    time.sleep(0.25)
+    upstream.default = 200
+    assert http_get('sheets', upstream.url).status_code == 200
+    assert breaker.stats()['state'] == 'closed'
+
+
+def test_half_open_lets_a_single_trial_through():
+    breaker = CircuitBreaker('sheets', failure_threshold=1, reset_seconds=0)
+    breaker.record_failure()
+    
+    assert breaker.allow()
+    assert not breaker.allow()
+    
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+
+def test_retry_delay_honours_retry_after():
+    response = requests.Response()
+    response.headers['Retry-After'] = "1"
+    assert get_retry_delay(0, response) == 1.0
+    
+    # Capped, so a long Retry-After does not hold the user
+    response.headers['Retry-After'] = "120"
+    assert get_retry_delay(0, response) == app.HTTP_BACKOFF_MAX_SECONDS
+    
+    # Otherwise full jitter up to the exponential backoff
+    for attempt in range(4):
+        delay = get_retry_delay(attempt)
+        assert 0 <= delay <= min(app.HTTP_BACKOFF_MAX_SECONDS, app.HTTP_BACKOFF_BASE_SECONDS * 2 ** attempt)
@@ -0,0 +1,35 @@
+import pandas as pd
+
+from app import RetrievalIndex
+
+FRAMES = {
+    'services': pd.DataFrame({
+        'Service': ["Bonafide Certificate", "Fee Payment", "Admission"],
+        'Office': ["Academic Office", "Accounts", "Admission Cell"],
+        'Room': ["A-101", "A-102", "B-201"],
+        'Working Hours': ["9 AM - 5 PM"] * 3,
+        'Description': ["Issue of bonafide certificates", "Pay tuition fees", "New admissions"],
+    }),
+    'labs': pd.DataFrame({
+        'Lab Name': ["Computer Lab"],
+        'Department': ["CSE"],
+        'Building': ["Block A"],
+        'Room': ["L-1"],
+        'Working Hours': ["9 AM - 5 PM"],
+        'Description': ["Workstations"],
+    }),
+}
+
+
+def test_context_is_only_the_relevant_rows():
+    index = RetrievalIndex(FRAMES)
+    
+    # "a" (A-101, Block A) and the column labels must not pull in other rows
+    context = index.select_context("How do I get a bonafide certificate?")
+    assert len(context) == 1
+    assert "Bonafide Certificate" in context[0]
+
+
+def test_unrelated_question_gets_no_context():
+    index = RetrievalIndex(FRAMES)
+    assert index.select_context("Where is the canteen?") == []
@@ -0,0 +1,78 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import app
+from app import SHEET_SCHEMAS, SheetSnapshot, parse_sheet_csv, route_question
+
+SHEETS = {
+    'faculty': (
+        b"Name,Department,Subject,Role,Room\n"
+        b"Brojo Kishore Mishra,CSE,DBMS,HOD,CS-201\n"
+        b"Ram Das,ECE,Circuits,HOD,EC-101\n"
+        b"Ramesh Das,ECE,Signals,Professor,EC-105\n"
+    ),
+    'services': (
+        b"Service,Office,Room,Working Hours,Description\n"
+        b"Bonafide Certificate,Academic Office,A-101,9 AM - 5 PM,Issue of bonafide certificates\n"
+        b"Fee Payment,Accounts Office,A-102,10 AM - 4 PM,Pay tuition fees\n"
+    ),
+    'labs': (
+        b"Lab Name,Department,Building,Room,Working Hours,Description\n"
+        b"Computer Lab,CSE,Block A,L-1,8 AM - 8 PM,Workstations\n"
+    ),
+}
+
+
+class FixedLoader:
+    """Serves one fixed snapshot, like a SheetLoader whose sheet never changes."""
+    
+    def __init__(self, name, content):
+        # Versions unlikely to collide with other tests' process-wide caches
+        self.snapshot = SheetSnapshot(
+            name, parse_sheet_csv(content, SHEET_SCHEMAS[name]), 9001, name, None, None,
+            datetime(2026, 10, 16, 9, 0, tzinfo=ZoneInfo("Asia/Kolkata"))
+        )
+    
+    def get_snapshot(self):
+        return self.snapshot
+    
+    def peek_snapshot(self):
+        return self.snapshot
+
+
+@pytest.fixture(autouse=True)
+def directory(monkeypatch):
+    loaders = {name: FixedLoader(name, content) for name, content in SHEETS.items()}
+    monkeypatch.setattr(app, 'get_sheet_loader', lambda name: loaders[name])
+
+
+def test_role_question_is_answered_directly():
+    routed = route_question("Who is the HOD of CSE?")
+    assert routed['intent'] == 'role'
+    assert "Brojo Kishore Mishra" in routed['answer']
+
+
+def test_location_question_is_answered_directly():
+    routed = route_question("Where is the computer lab?")
+    assert routed['intent'] == 'location'
+    assert "L-1" in routed['answer']
+
+
+def test_hours_question_is_answered_directly():
+    routed = route_question("When does fee payment open?")
+    assert routed['intent'] == 'hours'
+    assert "10 AM - 4 PM" in routed['answer']
+
+
+@pytest.mark.parametrize('question', [
+    # Two faculty members named "... Das": ambiguous
+    "Where does Das sit?",
+    # Not a lookup
+    "How do I prepare for the DBMS exam?",
+    # Nothing in the directory
+    "Where is the canteen?",
+])
+def test_other_questions_fall_through_to_the_model(question):
+    assert route_question(question) is None
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from app import SEARCH_CACHE_ENTRY_OVERHEAD_BYTES, SearchResultCache
+
+
+def positions(count):
+    return np.arange(count, dtype=np.int32)
+
+
+def entry_size(count):
+    return positions(count).nbytes + SEARCH_CACHE_ENTRY_OVERHEAD_BYTES
+
+
+def test_repeated_query_is_a_hit():
+    cache = SearchResultCache()
+    searches = []
+    
+    def search():
+        searches.append(1)
+        return positions(3)
+    
+    first = cache.get_or_search(('faculty', 'substring', 1, 'ram'), search)
+    second = cache.get_or_search(('faculty', 'substring', 1, 'ram'), search)
+    
+    assert len(searches) == 1
+    assert second is first
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    
+    # Shared between sessions, so callers cannot modify it
+    with pytest.raises(ValueError):
+        first[0] = 5
+
+
+def test_least_recently_used_entries_are_evicted_to_fit_the_budget():
+    cache = SearchResultCache(max_bytes=3 * entry_size(100))
+    for query in ['a', 'b', 'c']:
+        cache.get_or_search(query, lambda: positions(100))
+    
+    # Touch 'a' so 'b' becomes the least recently used
+    cache.get_or_search('a', lambda: positions(100))
+    cache.get_or_search('d', lambda: positions(100))
+    
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 3
+    assert stats['bytes'] <= cache.max_bytes
+    
+    misses = stats['misses']
+    cache.get_or_search('a', lambda: positions(100))
+    assert cache.stats()['misses'] == misses
+    cache.get_or_search('b', lambda: positions(100))
+    assert cache.stats()['misses'] == misses + 1
+
+
+def test_one_large_result_evicts_several_small_ones():
+    cache = SearchResultCache(max_bytes=entry_size(1000))
+    for query in ['a', 'b', 'c']:
+        cache.get_or_search(query, lambda: positions(10))
+    
+    cache.get_or_search('big', lambda: positions(900))
+    
+    assert cache.stats()['bytes'] <= cache.max_bytes
+    assert cache.stats()['evictions'] >= 1
+
+
+def test_result_larger_than_the_budget_is_not_cached():
+    cache = SearchResultCache(max_bytes=entry_size(10))
+    result = cache.get_or_search('huge', lambda: positions(1000))
+    
+    assert len(result) == 1000
+    assert cache.stats()['entries'] == 0 and cache.stats()['bytes'] == 0
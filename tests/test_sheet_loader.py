@@ -0,0 +1,93 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pandas as pd
+import pytest
+
+import app
+from app import SHEET_SCHEMAS, SheetLoader, parse_sheet_csv, prepare_snapshot_indexes
+
+FACULTY_CSV = (
+    b"Name,Department,Subject,Role,Room\n"
+    b"Brojo Kishore Mishra,CSE,DBMS,HOD,CS-201\n"
+    b"Ram Das,ECE,Circuits,Professor,EC-101\n"
+)
+
+
+@pytest.fixture
+def sheet_stub():
+    """A local stand-in for a sheet's CSV export."""
+    
+    class Stub:
+        body = FACULTY_CSV
+        status = 200
+    
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+        
+        def do_GET(self):
+            self.send_response(Stub.status)
+            self.send_header('Content-Length', str(len(Stub.body)))
+            self.end_headers()
+            self.wfile.write(Stub.body)
+    
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Stub.url = f"http://127.0.0.1:{server.server_port}/export"
+    yield Stub
+    server.shutdown()
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, 'SNAPSHOT_DIR', str(tmp_path))
+    return tmp_path
+
+
+def make_faculty_loader(url, ttl_seconds=300):
+    return SheetLoader(
+        'faculty', url, lambda content: parse_sheet_csv(content, SHEET_SCHEMAS['faculty']),
+        ttl_seconds=ttl_seconds, prepare=prepare_snapshot_indexes
+    )
+
+
+def test_new_version_is_served_with_its_indexes_built(sheet_stub, snapshot_dir):
+    loader = make_faculty_loader(sheet_stub.url)
+    snapshot = loader.get_snapshot()
+    
+    assert snapshot.version == 1
+    for name in app.SHEET_INDEXES['faculty']:
+        assert snapshot.has_derived(name)
+
+
+def test_restored_snapshot_is_marked_until_upstream_confirms_it(sheet_stub, snapshot_dir):
+    make_faculty_loader(sheet_stub.url).get_snapshot()
+    
+    # A new process starts from the saved copy
+    loader = make_faculty_loader(sheet_stub.url, ttl_seconds=0)
+    assert loader.peek_snapshot().restored
+    
+    # Same content upstream: confirmed, not re-parsed
+    restored = loader.peek_snapshot()
+    assert loader.revalidate() is restored
+    assert not restored.restored
+
+
+@pytest.mark.parametrize('columns, metadata', [
+    # Saved by an older app: a required column is missing
+    (['Name', 'Department'], {'version': 3, 'content_hash': 'x', 'fetched_at': '2026-10-16T09:00:00+05:30'}),
+    # Incomplete metadata
+    (['Name', 'Department', 'Subject', 'Role', 'Room'], {'version': 3}),
+])
+def test_unusable_saved_snapshot_is_ignored(sheet_stub, snapshot_dir, columns, metadata):
+    frame = pd.DataFrame({column: ["x"] for column in columns})
+    app.save_snapshot_table('sheet_faculty', frame, metadata)
+    
+    loader = make_faculty_loader(sheet_stub.url)
+    assert loader.peek_snapshot() is None
+    
+    # The sheet is downloaded instead
+    snapshot = loader.get_snapshot()
+    assert snapshot.version == 1
+    assert list(snapshot.data['Name']) == ["Brojo Kishore Mishra", "Ram Das"]
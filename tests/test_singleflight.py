@@ -0,0 +1,113 @@
+import threading
+import time
+
+from app import SingleFlight
+
+
+def run_concurrently(count, target):
+    """Start count threads on target, staggered so the first one leads."""
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_callers_share_one_call():
+    flights = SingleFlight()
+    calls = []
+    results = []
+    
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return 42
+    
+    run_concurrently(5, lambda: results.append(flights.do('sheet', fetch)))
+    
+    assert len(calls) == 1
+    assert results == [42] * 5
+    assert not flights.in_flight('sheet')
+
+
+def test_leader_exception_reaches_joined_callers():
+    flights = SingleFlight()
+    calls = []
+    errors = []
+    
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("upstream down")
+    
+    def caller():
+        try:
+            flights.do('sheet', fetch)
+        except ValueError as e:
+            errors.append(e)
+    
+    run_concurrently(4, caller)
+    
+    assert len(calls) == 1
+    assert len(errors) == 4
+    assert all(str(e) == "upstream down" for e in errors)
+    
+    # The key is free again: the next caller makes a new call
+    assert flights.do('sheet', lambda: "recovered") == "recovered"
+
+
+def test_stream_is_shared_with_joined_callers():
+    flights = SingleFlight()
+    calls = []
+    outputs = []
+    
+    def make_stream(meta):
+        calls.append(1)
+        meta['first_token_seconds'] = 0.1
+        for chunk in ["The office ", "is in ", "Block A."]:
+            time.sleep(0.05)
+            yield chunk
+    
+    def caller():
+        meta = {}
+        text = "".join(flights.stream('question', make_stream, meta))
+        outputs.append((text, meta.get('shared', False), meta['first_token_seconds']))
+    
+    run_concurrently(3, caller)
+    
+    assert len(calls) == 1
+    assert sorted(outputs, key=lambda output: output[1]) == [
+        ("The office is in Block A.", False, 0.1),
+        ("The office is in Block A.", True, 0.1),
+        ("The office is in Block A.", True, 0.1),
+    ]
+
+
+def test_abandoned_stream_fails_joined_callers():
+    flights = SingleFlight()
+    errors = []
+    
+    def make_stream(meta):
+        yield "partial"
+        yield "rest"
+    
+    leader = flights.stream('question', make_stream, {})
+    assert next(leader) == "partial"
+    
+    def follower():
+        try:
+            list(flights.stream('question', make_stream, {}))
+        except RuntimeError as e:
+            errors.append(e)
+    
+    thread = threading.Thread(target=follower)
+    thread.start()
+    time.sleep(0.05)
+    
+    # The leader's consumer goes away mid-stream
+    leader.close()
+    thread.join(1)
+    
+    assert len(errors) == 1
+    assert not flights.in_flight('question')